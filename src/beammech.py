@@ -9,7 +9,8 @@ Beammech is a package for solving the differential equations for pure bending
 d²y/dx² = M/(E·I) and shear dy/dx = α·V/(G·A) of beams.
 
 The main interface is the ``solve`` function. It returns a ``types.SimpleNamespace``.
-Saving the returned information to file is done with the ``save`` function.
+Saving the returned information to file is done with the ``save`` function,
+or with ``save_binary`` for numpy's binary format.
 
 Before we can solve the problem we need to define it.
 The length of the beam and the location of the supports are the initial
@@ -145,18 +146,30 @@ results are returned in a dictionary.  The following keys exist;
     If 'supports' was provided, R is a 2-tuple of the reaction forces at said
     supports. Else R[0] is the reaction force at the clamped x=0 and R[1] is
     the reaction moment at that point
+
+By default all arrays are calculated in double precision.  If memory
+bandwidth matters more than the last digits, pass ``dtype=np.float32`` to
+``solve`` to do the calculations in single precision.
+
+To solve the same beam for several sets of loads, for example in a
+parametric study, use ``solve_many``.  It takes an iterable of load sets
+instead of a single set of loads, and returns a list of results.
+
+.. code-block:: python
+
+    results = bm.solve_many(length, supports, [L1, [L2, L3]], EI, GA, top, bottom, True)
 """
 
 from datetime import datetime
 from os.path import basename
 from types import SimpleNamespace
-import math
+import numbers
 import numpy as np
 
 __version__ = "2020.10"
 
 
-def solve(length, supports, loads, EI, GA, top, bottom, shear):  # {{{
+def solve(length, supports, loads, EI, GA, top, bottom, shear, dtype=np.float64):  # {{{
     """Solve the beam problem.
 
     Arguments:
@@ -175,6 +188,11 @@ def solve(length, supports, loads, EI, GA, top, bottom, shear):  # {{{
             under the neutral line in every mm of the cross-section of the beam.
         shear: A boolean indication if shear deformations should be
              included. Will be added and set to 'True' if not provided.
+        dtype: The floating point type used for the arrays. Defaults to
+            numpy.float64. Using numpy.float32 halves the memory traffic at
+            the cost of precision.
+            EI, GA, top and bottom arrays that already have this dtype are used
+            without making a copy.
 
     Returns:
         This function returns a types.SimpleNamespace with following items:
@@ -199,58 +217,56 @@ def solve(length, supports, loads, EI, GA, top, bottom, shear):  # {{{
     """
     length, s1, s2 = _check_length_supports(length, supports)
     loads = _check_loads(loads)
-    loads = [ld for ld in loads]  # make a copy since we modifiy it!
-    EI, GA, top, bot = _check_arrays(length, EI, GA, top, bottom)
+    EI, GA, top, bot = _check_arrays(length, EI, GA, top, bottom, dtype)
     if shear not in (True, False):
         raise ValueError("shear should be a boolean")
-    # Calculate support loads.
-    moment = sum([ld.moment(s1) for ld in loads])
-    if s2:
-        R2 = Load(force=-moment / (s2 - s1), pos=s2)
-        loads.append(R2)
-    else:  # clamped at x = 0
-        R2 = -moment
-    # Force equilibrium
-    R1 = Load(force=-sum([ld.size for ld in loads]), pos=s1)
-    loads.append(R1)
-    # Calculate shear force
-    D = np.sum(np.array([ld.shear(length) for ld in loads]), axis=0)
-    # Calculate bending moment
-    M = np.cumsum(D)
-    Mstep = np.sum(
-        np.array(
-            [ld.moment_array(length) for ld in loads if isinstance(ld, MomentLoad)]
-        ),
-        axis=0,
-    )
-    M += Mstep
-    if s2 is None:
-        M -= M[-1]
-    ddy_b = M / EI
-    etop, ebot = -top * ddy_b, -bot * ddy_b
-    dy = np.cumsum(ddy_b)
-    if shear:
-        dy += -1.5 * D / GA  # shear
-    y = np.cumsum(dy)
-    if s2:
-        # First, translate the whole list so that the value at the
-        # index anchor is zero.
-        y = y - y[s1]
-        # Then rotate around the anchor so that the deflection at the other
-        # support is also 0.
-        delta = -y[s2] / math.fabs(s1 - s2)
-        slope = (
-            np.concatenate((np.arange(-s1, 1, 1), np.arange(1, len(y) - s1))) * delta
-        )
-        dy += delta
-        y = y + slope
-    results = SimpleNamespace()
-    results.length = length
-    results.D, results.M = D, M
-    results.dy, results.y, results.R = dy, y, (R1, R2)
-    results.a = np.arctan(dy)
-    results.etop, results.ebot = etop, ebot
-    return results  # }}}
+    D, Mstep, R = _assemble(loads, length, s1, s2, dtype)
+    M, dy, y, etop, ebot = _integrate(D, Mstep, EI, GA, top, bot, s1, s2, shear)
+    return _results(length, R, D, M, dy, y, etop, ebot)  # }}}
+
+
+def solve_many(
+    length, supports, loadsets, EI, GA, top, bottom, shear, dtype=np.float64
+):  # {{{
+    """Solve the same beam for several sets of loads.
+
+    This gives the same results as calling solve() for every set of loads.
+    But the beam properties are only validated once, and the integrations are
+    done on 2D arrays for all sets of loads together. This is faster for
+    parametric studies with many load cases on a single beam.
+
+    Arguments:
+        loadsets: An iterable of which every item is either a Load or an
+            iterable of Loads. Note that a flat list of Loads is therefore
+            solved as one set of loads per Load.
+        The other arguments are the same as for solve().
+
+    Returns:
+        A list with a types.SimpleNamespace for every set of loads, with the
+        same items as returned by solve().
+    """
+    length, s1, s2 = _check_length_supports(length, supports)
+    if loadsets is None:
+        raise ValueError("No sets of loads specified")
+    if isinstance(loadsets, Load):
+        raise ValueError("loadsets must be an iterable of sets of loads")
+    loadsets = [_check_loads(loads) for loads in loadsets]
+    if not loadsets:
+        raise ValueError("No sets of loads specified")
+    EI, GA, top, bot = _check_arrays(length, EI, GA, top, bottom, dtype)
+    if shear not in (True, False):
+        raise ValueError("shear should be a boolean")
+    parts = [_assemble(loads, length, s1, s2, dtype) for loads in loadsets]
+    D = np.stack([D for D, _, _ in parts])
+    Mstep = None
+    if any(Ms is not None for _, Ms, _ in parts):
+        zeros = np.zeros(length + 1, dtype=dtype)
+        Mstep = np.stack([zeros if Ms is None else Ms for _, Ms, _ in parts])
+    M, dy, y, etop, ebot = _integrate(D, Mstep, EI, GA, top, bot, s1, s2, shear)
+    return [
+        _results(length, R, D[n], M[n], dy[n], y[n], etop[n], ebot[n])
+        for n, (_, _, R) in enumerate(parts)
+    ]  # }}}
 
 
 def save(results, path):  # {{{
@@ -272,23 +288,31 @@ def save(results, path):  # {{{
     Raises:
         AttributeError if the results have not been solved yet.
     """
-    data = np.vstack(
-        (
-            np.arange(results.length + 1),
-            results.D,
-            results.M,
-            results.y,
-            results.etop,
-            results.ebot,
-            results.dy,
-        )
-    ).T
+    data = _columns(results)
     p = basename(path)
     d = str(datetime.now())[:-7]
     h = f"file: {p}\ngenerated: {d}\nx D M y et eb dy"
     np.savetxt(path, data, fmt="%g", header=h)  # }}}
 
 
+def save_binary(results, path):  # {{{
+    """
+    Save the data from a solved results to a file in numpy's binary “.npy”
+    format. This is much faster than save() for large or many results. The
+    file contains an array with the same columns as written by save(). It can
+    be read back with numpy.load().
+
+    Arguments:
+        results: Results dictionary.
+        path: Location where the data should be saved. The extension “.npy”
+            is appended if it is not already present.
+
+    Raises:
+        AttributeError if the results have not been solved yet.
+    """
+    np.save(path, _columns(results))  # }}}
+
+
 def EI(sections, normal=None):  # {{{
     """Calculate the bending stiffnes of a cross-section.
 
@@ -301,7 +325,8 @@ def EI(sections, normal=None):  # {{{
     E is the Young's modulus of the material of this section.
 
     Arguments:
-        sections: Iterable of section properties.
+        sections: Iterable of section properties, or a numpy array with a row
+            for every section.
         normal: The Young's modulus to which the total cross-section will be
             normalized. (Not used anymore, retained for compatibility.)
 
@@ -334,29 +359,17 @@ def EI(sections, normal=None):  # {{{
         >>> EI(sections)
         (9393560891.143106, 11.530104712041885, -19.469895287958117)
     """
-    normal = sections[0][-1]
-    normalized = tuple((w * E / normal, h, offs) for w, h, offs, E in sections)
-    A = sum(w * h for w, h, _ in normalized)
-    S = sum(w * h * (offs + h / 2) for w, h, offs in normalized)
+    w, h, offs, E = np.asarray(sections, dtype=np.float64).T
+    normalized = w * E / E[0]
+    A = np.dot(normalized, h)
+    S = np.dot(normalized * h, offs + h / 2)
     yn = S / A
-    # Find any geometry that straddles yn.
-    to_split = tuple(g for g in sections if g[2] < yn and g[1] + g[2] > yn)
-    geom = tuple(g for g in sections if g not in to_split)
-    # split that geometry.
-    # The new tuple has the format (width, height, top, bottom)
-    new_geom = []
-    for w, h, offs, E in to_split:
-        h1 = yn - offs
-        h2 = h - h1
-        new_geom.append((w, h1, h1, 0, E))
-        new_geom.append((w, h2, 0, -h2, E))
-    # Convert the remaining geometry to reference yn.
-    for w, h, offs, E in geom:
-        new_geom.append((w, h, yn - offs, yn - offs - h, E))
-    EI = sum(E * w * (top**3 - bot**3) / 3 for w, h, top, bot, E in new_geom)
-    top = max(g[-3] for g in new_geom)
-    bot = min(g[-2] for g in new_geom)
-    return EI, top, bot  # }}}
+    # Top and bottom of every section with reference to yn. The integral of
+    # z² from bottom to top also holds for sections that straddle yn.
+    tops = yn - offs
+    bots = tops - h
+    EI = np.sum(E * w * (tops**3 - bots**3) / 3)
+    return float(EI), float(tops.max()), float(bots.min())  # }}}
 
 
 def interpolate(tuples):  # {{{
@@ -381,17 +394,20 @@ def interpolate(tuples):  # {{{
         array([ 1. ,  2. ,  3. ,  4. ,  0.5, -3. ])
     """
     x = np.array([int(round(x)) for x, _ in tuples])
-    y = np.array([y for _, y in tuples])
-    startx, starty = x[0], y[0]
-    arrays = []
-    for dx, dy in zip(x[1:] - x[:-1], y[1:] - y[:-1]):
-        if dx > 0:
-            a = np.linspace(starty, starty + dy, num=dx + 1, endpoint=True)
-            arrays.append(a[:-1])
-        startx += dx
-        starty += dy
-    arrays.append(np.array([y[-1]]))
-    return np.concatenate(arrays)  # }}}
+    y = np.array([y for _, y in tuples], dtype=np.float64)
+    return np.interp(np.arange(x[0], x[-1] + 1), x, y)  # }}}
+
+
+# Weight distribution of a patient according to IEC 60601;
+# (fraction of the mass, start, end) with the positions in mm from the feet.
+_PATIENT = (
+    (0.148, 0, 450),  # l. legs, 14.7% from 0--450 mm
+    (0.222, 450, 1000),  # upper legs
+    (0.074, 1000, 1180),  # hands
+    (0.408, 1000, 1700),  # torso
+    (0.074, 1200, 1700),  # arms
+    (0.074, 1220, 1900),  # head
+)
 
 
 def patientload(**kwargs):  # {{{
@@ -419,15 +435,10 @@ def patientload(**kwargs):  # {{{
         s = round(float(kwargs["head"])) - 1900
     else:
         raise ValueError("No 'feet' nor 'head' given.")
-    fractions = [
-        (0.148 * f, (s + 0, s + 450)),  # l. legs, 14.7% from 0--450 mm
-        (0.222 * f, (s + 450, s + 1000)),  # upper legs
-        (0.074 * f, (s + 1000, s + 1180)),  # hands
-        (0.408 * f, (s + 1000, s + 1700)),  # torso
-        (0.074 * f, (s + 1200, s + 1700)),  # arms
-        (0.074 * f, (s + 1220, s + 1900)),
-    ]  # head
-    return [DistLoad(force=i[0], pos=i[1]) for i in fractions]  # }}}
+    return [
+        DistLoad(force=frac * f, pos=(s + start, s + end))
+        for frac, start, end in _PATIENT
+    ]  # }}}
 
 
 class Load(object):  # {{{
@@ -460,19 +471,23 @@ class Load(object):  # {{{
         """
         return (self.pos - pos) * self.size
 
-    def shear(self, length):
+    def shear(self, length, dtype=np.float64, out=None):
         """
         Return the contribution of the load to the shear.
 
         Arguments:
             length: length of the array to return.
+            dtype: floating point type of the array.
+            out: optional array of size length+1. If given, the contribution
+                is added to this array instead of to a newly allocated one.
 
         Returns:
             An array that contains the contribution of this load.
         """
-        rv = np.zeros(length + 1)
-        rv[self.pos :] = self.size
-        return rv  # }}}
+        if out is None:
+            out = np.zeros(length + 1, dtype=dtype)
+        out[self.pos :] += self.size
+        return out  # }}}
 
 
 class MomentLoad(Load):  # {{{
@@ -495,29 +510,34 @@ class MomentLoad(Load):  # {{{
         """
         return self.m
 
-    def shear(self, length):
+    def shear(self, length, dtype=np.float64, out=None):
         """
         Return the contribution of the load to the shear.
 
         Arguments:
             length: length of the array to return.
+            dtype: floating point type of the array.
+            out: optional array of size length+1 to add the contribution to.
 
         Returns:
             An array that contains the contribution of this load.
         """
-        return np.zeros(length + 1)
+        if out is None:
+            out = np.zeros(length + 1, dtype=dtype)
+        return out
 
-    def moment_array(self, length):
+    def moment_array(self, length, dtype=np.float64):
         """
         Return the contribution of the load to the bending moment.
 
         Arguments:
             length: length of the array to return.
+            dtype: floating point type of the array.
 
         Returns:
             An array that contains the contribution of this load.
         """
-        rv = np.zeros(length + 1)
+        rv = np.zeros(length + 1, dtype=dtype)
         rv[self.pos :] = -self.m
         return rv  # }}}
 
@@ -551,12 +571,13 @@ class DistLoad(Load):  # {{{
             f"constant distributed load of {self.size} N @ {self.start}--{self.end} mm."
         )
 
-    def shear(self, length):
-        rem = length + 1 - self.end
+    def shear(self, length, dtype=np.float64, out=None):
+        if out is None:
+            out = np.zeros(length + 1, dtype=dtype)
         d = self.end - self.start
-        q = self.size
-        parts = (np.zeros(self.start), np.linspace(0, q, d), np.ones(rem) * q)
-        return np.concatenate(parts)  # }}}
+        out[self.start : self.end] += np.linspace(0, self.size, d, dtype=dtype)
+        out[self.end :] += self.size
+        return out  # }}}
 
 
 class TriangleLoad(DistLoad):  # {{{
@@ -588,19 +609,25 @@ class TriangleLoad(DistLoad):  # {{{
             d = "descending"
         return f"linearly {d} distributed load of {self.size} N @ {self.start}--{self.end} mm."
 
-    def shear(self, length):
-        rem = length + 1 - self.end
-        parts = (
-            np.zeros(self.start),
-            np.linspace(0, self.q, self.end - self.start),
-            np.ones(rem) * self.q,
-        )
-        dv = np.concatenate(parts)
-        return np.cumsum(dv)  # }}}
+    def shear(self, length, dtype=np.float64, out=None):
+        if out is None:
+            out = np.zeros(length + 1, dtype=dtype)
+        # Like a distributed load, a load of at most 1 mm acts as a point load
+        # at its end.
+        if self.end - self.start > 1:
+            ramp = np.linspace(0, self.q, self.end - self.start, dtype=dtype)
+            np.cumsum(ramp, out=ramp)
+            out[self.start : self.end] += ramp
+        # There is no load past the end, so the shear stays constant there.
+        out[self.end :] += self.size
+        return out  # }}}
 
 
 # Everything below is internal to the module.
 
+# Kinds of load in the array representation made by _load_arrays().
+_POINT, _DIST, _TRIANGLE, _MOMENT = 0, 1, 2, 3
+
 
 def _force(**kwargs):  # {{{
     """
@@ -647,6 +674,26 @@ def _start_end(**kwargs):  # {{{
     return pos  # }}}
 
 
+def _columns(results):  # {{{
+    """
+    Gather the data from solved results into columns. See save().
+
+    Returns:
+        A 2D array with the columns x, D, M, y, etop, ebot and dy.
+    """
+    return np.column_stack(
+        (
+            np.arange(results.length + 1),
+            results.D,
+            results.M,
+            results.y,
+            results.etop,
+            results.ebot,
+            results.dy,
+        )
+    )  # }}}
+
+
 def _check_length_supports(length, supports):  # {{{
     """
     Validate the length and supports. See solve().
@@ -690,24 +737,24 @@ def _check_loads(loads):  # {{{
     return list(loads)  # }}}
 
 
-def _check_arrays(L, EI, GA, top, bottom):  # {{{
+def _check_arrays(L, EI, GA, top, bottom, dtype=np.float64):  # {{{
     """
     Validate the length of the EI, GA, top and bot iterables and converts
-    them into numpy arrays. See solve().
+    them into numpy arrays of the given dtype. See solve().
+    Numpy arrays that already have the right dtype are used without copying.
 
     Returns:
         The modified EI, GA, top and bottom arrays.
     """
     rv = []
     for name, ar in zip(("EI", "GA", "top", "bottom"), (EI, GA, top, bottom)):
-        # Convert single number to an ndarray.
-        if isinstance(ar, (int, float)):
-            ar = np.ones(L + 1) * ar
-        # Convert list/tuple to ndarray.
-        elif isinstance(ar, (list, tuple)):
-            ar = np.array(ar)
-        elif isinstance(ar, np.ndarray):
-            pass
+        # Convert single number to a read-only ndarray without allocating.
+        # numbers.Real also covers numpy integer and floating point scalars.
+        if isinstance(ar, numbers.Real):
+            ar = np.broadcast_to(np.asarray(ar, dtype=dtype), (L + 1,))
+        # Convert list/tuple to ndarray. Arrays of the right dtype are not copied.
+        elif isinstance(ar, (list, tuple, np.ndarray)):
+            ar = np.asarray(ar, dtype=dtype)
         else:
             raise ValueError(
                 f"{name} is not a int, float, list, tuple or numpy.ndarray"
@@ -719,3 +766,207 @@ def _check_arrays(L, EI, GA, top, bottom):  # {{{
             )
         rv.append(ar)
     return rv  # }}}
+
+
+def _assemble(loads, length, s1, s2, dtype):  # {{{
+    """
+    Calculate the support reactions, the shear force and the steps in the
+    bending moment for a list of loads. See solve().
+
+    Returns:
+        A tuple (D, Mstep, R). Mstep is None if there are no moment loads. R is
+        the 2-tuple of reactions as described in solve().
+    """
+    la = _load_arrays(loads)
+    # Distributed loads may end at length+1, like in DistLoad.shear().
+    if la.kind.size:
+        dist = (la.kind == _DIST) | (la.kind == _TRIANGLE)
+        if la.start.min() < 0 or (la.end - dist).max() > length:
+            raise ValueError("Loads must be within the length of the beam")
+    # Calculate support loads.
+    moment = float(np.dot(la.pos - s1, la.size) + la.m.sum())
+    moment += sum(ld.moment(s1) for ld in la.other)
+    force = float(la.size.sum()) + sum(ld.size for ld in la.other)
+    if s2:
+        R2 = Load(force=-moment / (s2 - s1), pos=s2)
+        force += R2.size
+    else:  # clamped at x = 0
+        R2 = -moment
+    # Force equilibrium
+    R1 = Load(force=-force, pos=s1)
+    # Calculate shear force
+    D = _shear_force(la, length, dtype)
+    # Loads with their own shear() are added the way they define it.
+    for ld in la.other:
+        D += ld.shear(length)
+    D[s1:] += R1.size
+    if s2:
+        D[s2:] += R2.size
+    # Calculate the steps in the bending moment caused by moment loads.
+    Mstep = None
+    mom = la.kind == _MOMENT
+    if mom.any():
+        Mstep = np.zeros(length + 2, dtype=dtype)
+        np.add.at(Mstep, la.end[mom], -la.m[mom])
+        Mstep = np.cumsum(Mstep, out=Mstep)[: length + 1]
+    for ld in la.other:
+        if isinstance(ld, MomentLoad):
+            if Mstep is None:
+                Mstep = np.zeros(length + 1, dtype=dtype)
+            Mstep += ld.moment_array(length)
+    return D, Mstep, (R1, R2)  # }}}
+
+
+def _integrate(D, Mstep, EI, GA, top, bot, s1, s2, shear):  # {{{
+    """
+    Integrate the shear force into bending moment, strains, deflection angle
+    and displacement. See solve(). Mstep holds the steps in the bending moment
+    caused by moment loads, or None if there are none.
+
+    Intermediate results are updated in place where possible, and the
+    translation and rotation that put the supports at zero displacement are
+    done in a single pass. D and Mstep can also be 2D arrays with a row for
+    every set of loads; the integration is then done along the rows.
+
+    Returns:
+        A tuple (M, dy, y, etop, ebot).
+    """
+    M = np.cumsum(D, axis=-1)
+    if Mstep is not None:
+        M += Mstep
+    if s2 is None:
+        M -= M[..., -1:].copy()
+    ddy_b = M / EI
+    etop = np.multiply(top, ddy_b)
+    np.negative(etop, out=etop)
+    ebot = np.multiply(bot, ddy_b)
+    np.negative(ebot, out=ebot)
+    # The curvature is not needed after this, so integrate it in place.
+    dy = np.cumsum(ddy_b, axis=-1, out=ddy_b)
+    if shear:
+        # Add -1.5·D/GA in place, using a single temporary array.
+        dys = np.divide(D, GA)
+        dys *= -1.5
+        dy += dys
+    y = np.cumsum(dy, axis=-1)
+    if s2:
+        # Translate the whole list so that the value at the index anchor is
+        # zero, and rotate it around the anchor so that the deflection at the
+        # other support is also 0.
+        # The supports are in ascending order; see _check_length_supports().
+        ys1 = y[..., s1, None].copy()
+        delta = -(y[..., s2, None] - ys1) / (s2 - s1)
+        slope = np.arange(-s1, y.shape[-1] - s1, dtype=y.dtype) * delta
+        slope -= ys1
+        dy += delta
+        y += slope
+    return M, dy, y, etop, ebot  # }}}
+
+
+def _results(length, R, D, M, dy, y, etop, ebot):  # {{{
+    """
+    Gather the results of a solved beam. See solve().
+
+    Returns:
+        A types.SimpleNamespace.
+    """
+    results = SimpleNamespace()
+    results.length = length
+    results.D, results.M = D, M
+    results.dy, results.y, results.R = dy, y, R
+    results.a = np.arctan(dy)
+    results.etop, results.ebot = etop, ebot
+    return results  # }}}
+
+
+def _load_arrays(loads):  # {{{
+    """
+    Convert the loads into parallel numpy arrays. See solve().
+
+    Returns:
+        A types.SimpleNamespace with the arrays kind, pos, start, end, size
+        and m. The kind is one of _POINT, _DIST, _TRIANGLE or _MOMENT. For
+        point and moment loads, start and end are equal to the position.
+        Loads of subclasses that override shear(), moment() or moment_array()
+        are not in the arrays but in the list other.
+    """
+    rows, other = [], []
+    for ld in loads:
+        if isinstance(ld, MomentLoad):
+            base, row = MomentLoad, (_MOMENT, ld.pos, ld.pos, ld.pos, 0.0, ld.m)
+        elif isinstance(ld, TriangleLoad):
+            base = TriangleLoad
+            row = (_TRIANGLE, ld.pos, ld.start, ld.end, ld.size, 0.0)
+        elif isinstance(ld, DistLoad):
+            base, row = DistLoad, (_DIST, ld.pos, ld.start, ld.end, ld.size, 0.0)
+        else:
+            base, row = Load, (_POINT, ld.pos, ld.pos, ld.pos, ld.size, 0.0)
+        cls = type(ld)
+        if any(
+            getattr(cls, name, None) is not getattr(base, name, None)
+            for name in ("shear", "moment", "moment_array")
+        ):
+            other.append(ld)
+        else:
+            rows.append(row)
+    rows = np.array(rows, dtype=np.float64).reshape(-1, 6)
+    kind, pos, start, end, size, m = rows.T
+    la = SimpleNamespace(other=other)
+    la.kind = kind.astype(np.int8)
+    la.pos, la.size, la.m = pos, size, m
+    la.start, la.end = start.astype(np.intp), end.astype(np.intp)
+    return la  # }}}
+
+
+def _shear_force(la, length, dtype):  # {{{
+    """
+    Calculate the shear force caused by the loads. See solve().
+
+    Instead of building an array for every load, each load is scattered as a
+    few jumps into a difference of the shear force. A point load is a jump in
+    the shear force, a distributed load a jump in its slope and a triangle
+    load a jump in its curvature. Up to three cumulative sums integrate them.
+
+    Arguments:
+        la: The loads as returned by _load_arrays().
+        length: The length of the beam.
+        dtype: The floating point type of the result.
+
+    Returns:
+        An array of size length+1 containing the shear force.
+    """
+    d = la.end - la.start
+    long = d > 1
+    bends = ramps = steps = None
+    # Triangle loads; q/(d-1) is the rise of the load per mm.
+    tri = (la.kind == _TRIANGLE) & long
+    if tri.any():
+        s, e, dt = la.start[tri], la.end[tri], d[tri]
+        k = 2 * la.size[tri] / (dt * (dt - 1))
+        bends = (
+            np.concatenate((s + 1, e, e + 1)),
+            np.concatenate((k, -dt * k, (dt - 1) * k)),
+        )
+    # Distributed loads longer than 1 mm.
+    dist = (la.kind == _DIST) & long
+    if dist.any():
+        s, e = la.start[dist], la.end[dist]
+        k = la.size[dist] / (d[dist] - 1)
+        ramps = (np.concatenate((s + 1, e)), np.concatenate((k, -k)))
+    # Point loads, and distributed or triangle loads of at most 1 mm. The
+    # latter act as point loads at their end.
+    pt = (la.kind != _MOMENT) & ~long
+    if pt.any():
+        steps = (la.end[pt], la.size[pt])
+    # Two extra elements to hold jumps just past the end of the beam.
+    D = np.zeros(length + 3, dtype=dtype)
+    # The cumulative sum of a zero array is zero, so the passes before the
+    # first jumps are skipped. A problem with only point loads needs one.
+    started = False
+    for jumps in (bends, ramps, steps):
+        if jumps is not None:
+            np.add.at(D, *jumps)
+            started = True
+        if started:
+            np.cumsum(D, out=D)
+    return D[: length + 1]  # }}}
@@ -7,18 +7,28 @@
 """Tests for beammech helper functions"""
 
 import numpy as np
+import pytest
 from beammech import interpolate, _force, _start_end, _check_arrays
 
 
 def test_interpolate():
-    assert np.all(interpolate([(0, 0), (3, 3)]) == np.array([0.0, 1.0, 2.0, 3.0]))
-    assert np.all(
-        interpolate([(0, 0), (4, 3), (6, -1)])
-        == np.array([0.0, 0.75, 1.5, 2.25, 3.0, 1.0, -1.0])
+    assert np.allclose(
+        interpolate([(0, 0), (3, 3)]),
+        np.array([0.0, 1.0, 2.0, 3.0]),
+        rtol=0,
+        atol=1e-12,
     )
-    assert np.all(
-        interpolate([(1, 1), (4, 4), (6, -3)])
-        == np.array([1.0, 2.0, 3.0, 4.0, 0.5, -3.0])
+    assert np.allclose(
+        interpolate([(0, 0), (4, 3), (6, -1)]),
+        np.array([0.0, 0.75, 1.5, 2.25, 3.0, 1.0, -1.0]),
+        rtol=0,
+        atol=1e-12,
+    )
+    assert np.allclose(
+        interpolate([(1, 1), (4, 4), (6, -3)]),
+        np.array([1.0, 2.0, 3.0, 4.0, 0.5, -3.0]),
+        rtol=0,
+        atol=1e-12,
     )
 
 
@@ -42,3 +52,16 @@ def test_check_arrays():
     for v in rv:
         assert isinstance(v, np.ndarray)
         assert len(v) == 101
+
+
+def test_check_arrays_numpy_scalars():
+    L = 100
+    rv = _check_arrays(L, np.float64(1.6e11), np.int64(250000), 12, -12.0)
+    for v in rv:
+        assert v.dtype == np.float64
+        assert len(v) == 101
+    assert rv[1][50] == 250000
+    with pytest.raises(ValueError, match="EI is not a int"):
+        _check_arrays(L, "abc", 1, 1, 1)
+    with pytest.raises(ValueError, match="GA is not a int"):
+        _check_arrays(L, 1, 1 + 2j, 1, 1)
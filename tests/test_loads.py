@@ -7,6 +7,7 @@
 """
 Tests for Load classes and load cases.
 """
+import functools
 import pytest
 import beammech as bm
 import numpy as np
@@ -20,6 +21,27 @@ h = 26
 Ix = B * (H ** 3 - h ** 3) / 12
 G = 28
 A = B * h
+Mload = 500 * 1000  # Moment load in [Nmm]
+
+
+@functools.lru_cache()
+def _arrays(L, EI, GA, H):
+    """
+    Arrays of EI, GA, top and bottom for a beam with a constant cross-section.
+    These are shared between tests, so they are made read-only. This also
+    checks that solve() doesn't modify them.
+    """
+    n = L + 1
+    rv = (np.full(n, EI), np.full(n, GA), np.full(n, H / 2), np.full(n, -H / 2))
+    for ar in rv:
+        ar.flags.writeable = False
+    return rv
+
+
+@pytest.fixture(scope="module")
+def beam_arrays():
+    """Beam property arrays for the module constants, shared between tests."""
+    return _arrays(L, E * Ix, G * A, H)
 
 
 def test_load_goodargs():  # {{{1
@@ -54,193 +76,174 @@ def test_load_badargs():  # {{{1
         bm.Load(force="-q", pos=200)
 
 
-def test_clamped_pointload():  # {{{1
-    """Clamped beam with point load at end"""
-    results = bm.solve(
-        L,
-        None,
-        bm.Load(force=P, pos=L),
-        np.ones(L + 1) * E * Ix,
-        np.ones(L + 1) * G * A,
-        np.ones(L + 1) * H / 2,
-        -np.ones(L + 1) * H / 2,
-        False,
-    )
-    deflection_bm = results.y[L]
-    deflection_formula = P * L ** 3 / (3 * E * Ix)
-    reldiff = abs((deflection_bm - deflection_formula) / deflection_formula)
-    assert reldiff < 0.005
+def test_load_subclass(beam_arrays):  # {{{1
+    """Subclasses of the load classes give the same results in solve()"""
 
+    class MyDist(bm.DistLoad):
+        def __str__(self):
+            return "my distributed load"
 
-def test_clamped_distributed():  # {{{1
-    """Clamped beam with distributed load"""
-    results = bm.solve(
-        L,
-        None,
-        bm.DistLoad(force=P, start=0, end=L),
-        np.ones(L + 1) * E * Ix,
-        np.ones(L + 1) * G * A,
-        np.ones(L + 1) * H / 2,
-        -np.ones(L + 1) * H / 2,
-        False,
-    )
-    deflection_bm = results.y[L]
-    deflection_formula = P * L ** 3 / (8 * E * Ix)
-    reldiff = abs((deflection_bm - deflection_formula) / deflection_formula)
-    assert reldiff < 0.005
+    class MyLoad(bm.Load):
+        def shear(self, length):
+            return super().shear(length)
 
+    class MyMoment(bm.MomentLoad):
+        def moment_array(self, length):
+            return super().moment_array(length)
 
-def test_supported_central_pointload():  # {{{1
-    """Ends supported beam with central point load"""
-    results = bm.solve(
-        L,
-        (0, L),
-        bm.Load(force=P, pos=L / 2),
-        np.ones(L + 1) * E * Ix,
-        np.ones(L + 1) * G * A,
-        np.ones(L + 1) * H / 2,
-        -np.ones(L + 1) * H / 2,
-        False,
-    )
-    deflection_bm = results.y[int(L / 2)]
-    deflection_formula = P * L ** 3 / (48 * E * Ix)
-    reldiff = abs((deflection_bm - deflection_formula) / deflection_formula)
-    assert reldiff < 0.005
+    for sub, ld in (
+        (
+            MyDist(force=P, start=200, end=700),
+            bm.DistLoad(force=P, start=200, end=700),
+        ),
+        (MyLoad(force=P, pos=L / 3), bm.Load(force=P, pos=L / 3)),
+        (MyMoment(2000, 300), bm.MomentLoad(2000, 300)),
+    ):
+        for supports in ((0, L), None):
+            other = bm.Load(force=P, pos=L / 2)
+            results = bm.solve(L, supports, [sub, other], *beam_arrays, True)
+            ref = bm.solve(L, supports, [ld, other], *beam_arrays, True)
+            assert np.allclose(results.D, ref.D)
+            assert np.allclose(results.y, ref.y)
 
 
-def test_supported_distributed():  # {{{1
-    """Ends supported beam with distributed load"""
-    results = bm.solve(
-        L,
-        (0, L),
-        bm.DistLoad(force=P, start=0, end=L),
-        np.ones(L + 1) * E * Ix,
-        np.ones(L + 1) * G * A,
-        np.ones(L + 1) * H / 2,
-        -np.ones(L + 1) * H / 2,
-        False,
-    )
-    deflection_bm = results.y[int(L / 2)]
-    deflection_formula = 5 * P * L ** 3 / (384 * E * Ix)
-    reldiff = abs((deflection_bm - deflection_formula) / deflection_formula)
-    assert reldiff < 0.005
+def test_load_outside_beam(beam_arrays):  # {{{1
+    """Loads that are not completely on the beam are rejected by solve()"""
+    for ld in (
+        bm.DistLoad(force=P, start=500, end=L + 200),
+        bm.DistLoad(force=P, start=-200, end=300),
+        bm.Load(force=P, pos=L + 1),
+        bm.MomentLoad(2000, -1),
+    ):
+        with pytest.raises(ValueError):
+            bm.solve(L, (0, L), ld, *beam_arrays, False)
 
 
-def test_supported_triangl():  # {{{1
-    """Ends supported beam with triangle load"""
-    results = bm.solve(
-        L,
-        (0, L),
-        bm.TriangleLoad(force=P, start=0, end=L),
-        np.ones(L + 1) * E * Ix,
-        np.ones(L + 1) * G * A,
-        np.ones(L + 1) * H / 2,
-        -np.ones(L + 1) * H / 2,
-        False,
-    )
-    deflection_bm = results.y[int(0.519 * L)]
-    deflection_formula = 0.01304 * P * L ** 3 / (E * Ix)
-    reldiff = abs((deflection_bm - deflection_formula) / deflection_formula)
-    assert reldiff < 0.005
+def test_load_shear_out():  # {{{1
+    """beammech.Load.shear accumulating into an existing array"""
+    loads = [bm.Load(force=-20, pos=300), bm.Load(force=5, pos=100)]
+    out = np.zeros(L + 1)
+    for ld in loads:
+        ld.shear(L, out=out)
+    assert np.array_equal(out, loads[0].shear(L) + loads[1].shear(L))
 
 
-def test_supported_pointloads():  # {{{1
-    """Ends supported beam with three equidistant point loads"""
-    results = bm.solve(
-        L,
-        (0, L),
-        [
-            bm.Load(force=P, pos=L / 4),
-            bm.Load(force=P, pos=L / 2),
-            bm.Load(force=P, pos=3 * L / 4),
-        ],
-        np.ones(L + 1) * E * Ix,
-        np.ones(L + 1) * G * A,
-        np.ones(L + 1) * H / 2,
-        -np.ones(L + 1) * H / 2,
-        False,
-    )
-    deflection_bm = results.y[int(L / 2)]
-    deflection_formula = 19 * P * L ** 3 / (384 * E * Ix)
-    reldiff = abs((deflection_bm - deflection_formula) / deflection_formula)
-    assert reldiff < 0.005
+def test_shear_force():  # {{{1
+    """The combined shear force matches the sum of the individual loads"""
+    loads = [
+        bm.Load(force=-20, pos=300),
+        bm.DistLoad(force=P, start=100, end=700),
+        bm.DistLoad(force=10, start=400, end=401),
+        bm.TriangleLoad(force=P, start=250, end=L),
+        bm.TriangleLoad(force=10, start=800, end=801),
+        bm.MomentLoad(2000, 500),
+    ]
+    D = bm._shear_force(bm._load_arrays(loads), L, np.float64)
+    assert np.allclose(D, sum(ld.shear(L) for ld in loads))
 
 
-def test_supported_moment_end():
-    """Ends supported beam with moment load at end."""
-    M = 500 * 1000
-    x = L - 422
+def test_short_triangleload():  # {{{1
+    """A triangle load of 1 mm is in equilibrium with the supports"""
     results = bm.solve(
-        L,
-        (0, L),
-        bm.MomentLoad(-M, L),
-        np.ones(L + 1) * E * Ix,
-        np.ones(L + 1) * G * A,
-        np.ones(L + 1) * H / 2,
-        -np.ones(L + 1) * H / 2,
-        False,
+        10, (0, 10), bm.TriangleLoad(force=-100, start=5, end=6), 1e6, 1e5, 1, -1, False
     )
-    deflection_bm = results.y[x]
-    deflection_formula = 0.0642 * M * L ** 2 / (E * Ix)
-    reldiff = abs((deflection_bm - deflection_formula) / deflection_formula)
-    assert reldiff < 0.005
+    assert results.D[-1] == 0
 
 
-def test_supported_moment_both():
-    """Ends supported beam with moment load at both ends."""
-    M = 500 * 1000 / 2
-    results = bm.solve(
-        L,
-        (0, L),
-        [bm.MomentLoad(M, 0), bm.MomentLoad(-M, L)],
-        np.ones(L + 1) * E * Ix,
-        np.ones(L + 1) * G * A,
-        np.ones(L + 1) * H / 2,
-        -np.ones(L + 1) * H / 2,
-        False,
-    )
-    deflection_bm = results.y[int(L / 2)]
-    deflection_formula = 6 * M * L ** 2 / (48 * E * Ix)
-    reldiff = abs((deflection_bm - deflection_formula) / deflection_formula)
-    assert reldiff < 0.005
+def test_triangleload_shear():  # {{{1
+    """The shear of a triangle load is constant past its end"""
+    ld = bm.TriangleLoad(force=P, start=200, end=500)
+    D = ld.shear(L)
+    assert np.all(D[:200] == 0)
+    assert np.allclose(D[499:], P)
+    short = bm.TriangleLoad(force=P, start=200, end=201)
+    assert np.array_equal(short.shear(L), bm.Load(force=P, pos=201).shear(L))
 
 
-def test_supported_moment_begin():
-    """Ends supported beam with moment load at begin."""
-    M = 500 * 1000
-    x = 422
-    results = bm.solve(
-        L,
-        (0, L),
-        bm.MomentLoad(M, 0),
-        np.ones(L + 1) * E * Ix,
-        np.ones(L + 1) * G * A,
-        np.ones(L + 1) * H / 2,
-        -np.ones(L + 1) * H / 2,
-        False,
-    )
+@pytest.mark.parametrize(
+    "supports,loads,x,formula",
+    [
+        pytest.param(
+            None,
+            bm.Load(force=P, pos=L),
+            L,
+            P * L ** 3 / (3 * E * Ix),
+            id="clamped_pointload",
+        ),
+        pytest.param(
+            None,
+            bm.DistLoad(force=P, start=0, end=L),
+            L,
+            P * L ** 3 / (8 * E * Ix),
+            id="clamped_distributed",
+        ),
+        pytest.param(
+            (0, L),
+            bm.Load(force=P, pos=L / 2),
+            int(L / 2),
+            P * L ** 3 / (48 * E * Ix),
+            id="supported_central_pointload",
+        ),
+        pytest.param(
+            (0, L),
+            bm.DistLoad(force=P, start=0, end=L),
+            int(L / 2),
+            5 * P * L ** 3 / (384 * E * Ix),
+            id="supported_distributed",
+        ),
+        pytest.param(
+            (0, L),
+            bm.TriangleLoad(force=P, start=0, end=L),
+            int(0.519 * L),
+            0.01304 * P * L ** 3 / (E * Ix),
+            id="supported_triangl",
+        ),
+        pytest.param(
+            (0, L),
+            [
+                bm.Load(force=P, pos=L / 4),
+                bm.Load(force=P, pos=L / 2),
+                bm.Load(force=P, pos=3 * L / 4),
+            ],
+            int(L / 2),
+            19 * P * L ** 3 / (384 * E * Ix),
+            id="supported_pointloads",
+        ),
+        pytest.param(
+            (0, L),
+            bm.MomentLoad(-Mload, L),
+            L - 422,
+            0.0642 * Mload * L ** 2 / (E * Ix),
+            id="supported_moment_end",
+        ),
+        pytest.param(
+            (0, L),
+            [bm.MomentLoad(Mload / 2, 0), bm.MomentLoad(-Mload / 2, L)],
+            int(L / 2),
+            6 * Mload / 2 * L ** 2 / (48 * E * Ix),
+            id="supported_moment_both",
+        ),
+        pytest.param(
+            (0, L),
+            bm.MomentLoad(Mload, 0),
+            422,
+            0.0642 * Mload * L ** 2 / (E * Ix),
+            id="supported_moment_begin",
+        ),
+        pytest.param(
+            None,
+            bm.MomentLoad(Mload, pos=L),
+            L,
+            Mload * L ** 2 / (2 * E * Ix),
+            id="clamped_moment_end",
+        ),
+    ],
+)
+def test_load_case(supports, loads, x, formula, beam_arrays):  # {{{1
+    """Deflection of clamped and ends supported beams versus the formulas"""
+    results = bm.solve(L, supports, loads, *beam_arrays, False)
     deflection_bm = results.y[x]
-    deflection_formula = 0.0642 * M * L ** 2 / (E * Ix)
-    reldiff = abs((deflection_bm - deflection_formula) / deflection_formula)
-    assert reldiff < 0.005
-
-
-def test_clamped_moment_end():
-    """Begin clamped, moment load at end."""
-    M = 500 * 1000
-    results = bm.solve(
-        L,
-        None,
-        bm.MomentLoad(M, pos=L),
-        np.ones(L + 1) * E * Ix,
-        np.ones(L + 1) * G * A,
-        np.ones(L + 1) * H / 2,
-        -np.ones(L + 1) * H / 2,
-        False,
-    )
-    deflection_bm = results.y[L]
-    deflection_formula = M * L ** 2 / (2 * E * Ix)
-    reldiff = abs((deflection_bm - deflection_formula) / deflection_formula)
+    reldiff = abs((deflection_bm - formula) / formula)
     assert reldiff < 0.005
 
 
@@ -256,14 +259,12 @@ def test_gvepet1():  # {{{1
     H = h + 2 * t
     Ix = B * (H ** 3 - h ** 3) / 12
     A = B * h
+    arrays = _arrays(L, E * Ix, G * A, H)
     results = bm.solve(
         L,
         (0, L),
         bm.Load(force=P, pos=L / 2),
-        np.ones(L + 1) * E * Ix,
-        np.ones(L + 1) * G * A,
-        np.ones(L + 1) * H / 2,
-        -np.ones(L + 1) * H / 2,
+        *arrays,
         False,
     )
     bending_bm = results.y[int(L / 2)]
@@ -272,10 +273,7 @@ def test_gvepet1():  # {{{1
         L,
         (0, L),
         bm.Load(force=P, pos=L / 2),
-        np.ones(L + 1) * E * Ix,
-        np.ones(L + 1) * G * A,
-        np.ones(L + 1) * H / 2,
-        -np.ones(L + 1) * H / 2,
+        *arrays,
         True,
     )
     total_bm = results.y[int(L / 2)]
@@ -298,14 +296,12 @@ def test_cvepet3():  # {{{1
     H = h + 2 * t
     Ix = B * (H ** 3 - h ** 3) / 12
     A = B * h
+    arrays = _arrays(L, E * Ix, G * A, H)
     results = bm.solve(
         L,
         (0, L),
         bm.Load(force=P, pos=L / 2),
-        np.ones(L + 1) * E * Ix,
-        np.ones(L + 1) * G * A,
-        np.ones(L + 1) * H / 2,
-        -np.ones(L + 1) * H / 2,
+        *arrays,
         False,
     )
     bending_bm = results.y[int(L / 2)]
@@ -314,10 +310,7 @@ def test_cvepet3():  # {{{1
         L,
         (0, L),
         bm.Load(force=P, pos=L / 2),
-        np.ones(L + 1) * E * Ix,
-        np.ones(L + 1) * G * A,
-        np.ones(L + 1) * H / 2,
-        -np.ones(L + 1) * H / 2,
+        *arrays,
         True,
     )
     total_bm = results.y[int(L / 2)]
@@ -326,3 +319,62 @@ def test_cvepet3():  # {{{1
     assert reldiff < 0.005
     reldifft = abs((total_bm - total_formula) / total_formula)
     assert reldifft < 0.02
+
+
+def test_supported_central_pointload_float32(beam_arrays):  # {{{1
+    """Ends supported beam with central point load in single precision"""
+    results = bm.solve(
+        L,
+        (0, L),
+        bm.Load(force=P, pos=L / 2),
+        *beam_arrays,
+        False,
+        dtype=np.float32,
+    )
+    assert results.y.dtype == np.float32
+    assert results.D.dtype == np.float32
+    deflection_bm = results.y[int(L / 2)]
+    deflection_formula = P * L ** 3 / (48 * E * Ix)
+    reldiff = abs((deflection_bm - deflection_formula) / deflection_formula)
+    assert reldiff < 0.005
+
+
+def test_save_binary(tmp_path, beam_arrays):  # {{{1
+    """Results saved in binary form can be read back"""
+    results = bm.solve(
+        L,
+        (0, L),
+        bm.Load(force=P, pos=L / 2),
+        *beam_arrays,
+        False,
+    )
+    path = tmp_path / "results.npy"
+    bm.save_binary(results, path)
+    data = np.load(path)
+    assert data.shape == (L + 1, 7)
+    assert np.array_equal(data[:, 3], results.y)
+
+
+@pytest.mark.parametrize("supports", [(0, L), (100, 900), None])
+def test_solve_many(supports, beam_arrays):  # {{{1
+    """Solving several sets of loads at once matches separate solves"""
+    loadsets = [
+        bm.Load(force=P, pos=L / 2),
+        [bm.DistLoad(force=P, start=0, end=L), bm.MomentLoad(2000, 300)],
+        bm.TriangleLoad(force=P, start=200, end=L),
+    ]
+    args = (*beam_arrays, True)
+    many = bm.solve_many(L, supports, loadsets, *args)
+    assert len(many) == len(loadsets)
+    for loads, results in zip(loadsets, many):
+        single = bm.solve(L, supports, loads, *args)
+        for name in ("D", "M", "dy", "y", "a", "etop", "ebot"):
+            assert np.allclose(getattr(results, name), getattr(single, name))
+
+
+def test_solve_many_single_load(beam_arrays):  # {{{1
+    """A single Load or None is not a valid set of load sets"""
+    with pytest.raises(ValueError):
+        bm.solve_many(L, (0, L), bm.Load(force=P, pos=L / 2), *beam_arrays, True)
+    with pytest.raises(ValueError, match="No sets of loads"):
+        bm.solve_many(L, (0, L), None, *beam_arrays, True)